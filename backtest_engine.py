@@ -23,6 +23,8 @@ from utils import (
     set_random_seed,
 )
 
+ACTION_NAMES = ("HOLD", "LONG", "SHORT", "CLOSE")
+
 
 def setup_logging(cfg: MasterConfig) -> None:
     """
@@ -137,8 +139,14 @@ class MetricsCollector:
         total_change = balances[-1] / balances[0] if balances[0] != 0 else 1.0
         trade_days = len(pnl_by_day)
 
-        std_pnl_by_day_neg = pnl_by_day[pnl_by_day < 0].std() if np.any(pnl_by_day < 0) else 0.0
-        std_pnl_all_neg = pnl_all[pnl_all < 0].std() if np.any(pnl_all < 0) else 0.0
+        day_mean, day_std = (pnl_by_day.mean(), pnl_by_day.std()) if trade_days > 0 else (0.0, 0.0)
+        trade_mean, trade_std = (pnl_all.mean(), pnl_all.std()) if len(pnl_all) > 0 else (0.0, 0.0)
+        day_neg = pnl_by_day[pnl_by_day < 0]
+        trade_neg = pnl_all[pnl_all < 0]
+        std_pnl_by_day_neg = day_neg.std() if day_neg.size else 0.0
+        std_pnl_all_neg = trade_neg.std() if trade_neg.size else 0.0
+        correct_changes = changes[changes > 0]
+        incorrect_changes = changes[changes <= 0]
 
         return {
             "total_commission": f"{(-self.total_commission / balances[0]) * 100:.2f}%" if balances[0] != 0 else "0.00%",
@@ -157,17 +165,17 @@ class MetricsCollector:
             ),
             "max_drawdown": f"{min(self.drawdowns) * 100:.2f}%" if self.drawdowns else "0.00%",
             "sharpe": (
-                f"{(pnl_by_day.mean() / (pnl_by_day.std() + 1e-9)) * np.sqrt(len(pnl_by_day)):.2f}"
-                if len(pnl_by_day) > 0
+                f"{(day_mean / (day_std + 1e-9)) * np.sqrt(trade_days):.2f}"
+                if trade_days > 0
                 else "0.00"
             ),
             "sortino": (
-                f"{(pnl_by_day.mean() / (std_pnl_by_day_neg + 1e-9)) * np.sqrt(len(pnl_by_day)):.2f}"
-                if len(pnl_by_day) > 0
+                f"{(day_mean / (std_pnl_by_day_neg + 1e-9)) * np.sqrt(trade_days):.2f}"
+                if trade_days > 0
                 else "0.00"
             ),
-            "trades_sharpe": (f"{pnl_all.mean() / (pnl_all.std() + 1e-9):.2f}" if len(pnl_all) > 0 else "0.00"),
-            "trades_sortino": (f"{pnl_all.mean() / (std_pnl_all_neg + 1e-9):.2f}" if len(pnl_all) > 0 else "0.00"),
+            "trades_sharpe": (f"{trade_mean / (trade_std + 1e-9):.2f}" if len(pnl_all) > 0 else "0.00"),
+            "trades_sortino": (f"{trade_mean / (std_pnl_all_neg + 1e-9):.2f}" if len(pnl_all) > 0 else "0.00"),
             "accuracy": (f"{self.correct_preds / self.total_trades * 100:.1f}%" if self.total_trades > 0 else "0.0%"),
             "total_trades": self.total_trades,
             "total_longs": self.total_longs,
@@ -182,13 +190,13 @@ class MetricsCollector:
                 if self.total_shorts == 0
                 else f"{self.correct_shorts} ({(self.correct_shorts / self.total_shorts) * 100:.1f}%)"
             ),
-            "correct_avg_change": (f"{np.mean(changes[changes > 0]) * 100:.2f}%" if np.any(changes > 0) else "0.00%"),
-            "correct_std_change": (f"{np.std(changes[changes > 0]) * 100:.2f}%" if np.any(changes > 0) else "0.00%"),
+            "correct_avg_change": (f"{correct_changes.mean() * 100:.2f}%" if correct_changes.size else "0.00%"),
+            "correct_std_change": (f"{correct_changes.std() * 100:.2f}%" if correct_changes.size else "0.00%"),
             "incorrect_avg_change": (
-                f"{np.mean(changes[changes <= 0]) * 100:.2f}%" if np.any(changes <= 0) else "0.00%"
+                f"{incorrect_changes.mean() * 100:.2f}%" if incorrect_changes.size else "0.00%"
             ),
             "incorrect_std_change": (
-                f"{np.std(changes[changes <= 0]) * 100:.2f}%" if np.any(changes <= 0) else "0.00%"
+                f"{incorrect_changes.std() * 100:.2f}%" if incorrect_changes.size else "0.00%"
             ),
             "avg_trade_amount": (f"{np.mean(self.trade_amounts):.2f}" if len(self.trade_amounts) > 0 else "0.00"),
             "trades_per_day": (f"{self.total_trades / trade_days:.2f}" if trade_days > 0 else "0.00"),
@@ -335,7 +343,7 @@ def run_backtest(cfg: MasterConfig) -> Dict[str, Any]:
                     pass_adv = get_pass_advantage(action, confidence, cfg)
                     if pass_adv:
                         logging.info(
-                            f": REJECTED {['LONG', 'SHORT', 'CLOSE'][action-1]}, "
+                            f": REJECTED {ACTION_NAMES[action]}, "
                             f"confidence={confidence:.3f} < threshold={thresholds[action-1]}"
                         )
                         action = 0
@@ -357,7 +365,7 @@ def run_backtest(cfg: MasterConfig) -> Dict[str, Any]:
                     pass_uncertainty = uncertainty >= cfg.backtest.ensemble_max_sigma
                     if pass_adv and pass_uncertainty:
                         logging.info(
-                            f": REJECTED {['LONG', 'SHORT', 'CLOSE'][action-1]}, "
+                            f": REJECTED {ACTION_NAMES[action]}, "
                             f"confidence={confidence:.3f} < threshold={thresholds[action-1]}, "
                             f"uncertainty={uncertainty:.3f} > max_sigma_threshold={cfg.backtest.ensemble_max_sigma}"
                         )
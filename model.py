@@ -30,6 +30,7 @@ class DuelingQNetwork(nn.Module):
         self.action_dim = action_dim
 
         channels, history_len, width = input_shape
+        self.history_flat_size = channels * history_len * width
         conv_layers = []
         in_ch = channels
         for out_ch, kernels, strides in zip(cnn_maps, cnn_kernels, cnn_strides):
@@ -68,9 +69,8 @@ class DuelingQNetwork(nn.Module):
 
     def forward(self, state: Tensor) -> Tensor:
         batch = state.size(0)
-        history_flat_size = torch.prod(torch.tensor(self.input_shape)).item()
-        history_part = state[:, :history_flat_size]
-        extra_part = state[:, history_flat_size:]
+        history_part = state[:, : self.history_flat_size]
+        extra_part = state[:, self.history_flat_size :]
 
         history_tensor = history_part.view(batch, *self.input_shape)
 
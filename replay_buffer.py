@@ -1,7 +1,7 @@
 # replay_buffer.py
 import logging
 import random
-from typing import List, Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -29,7 +29,12 @@ class PrioritizedReplayBuffer:
             self.tree_capacity <<= 1
         self.tree = np.zeros(2 * self.tree_capacity - 1, dtype=np.float64)
 
-        self.data: List[Tuple] = [None] * capacity
+        # states are allocated on the first add(), once the observation shape is known
+        self.states: Optional[np.ndarray] = None
+        self.next_states: Optional[np.ndarray] = None
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=bool)
         self.idx = 0
         self.size = 0
         self.max_priority = 1.0
@@ -59,8 +64,16 @@ class PrioritizedReplayBuffer:
         next_state: np.ndarray,
         done: bool,
     ) -> None:
+        if self.states is None:
+            self.states = np.zeros((self.capacity, *np.shape(state)), dtype=np.float32)
+            self.next_states = np.zeros_like(self.states)
+
         data_idx = self.idx
-        self.data[data_idx] = (state, action, reward, next_state, done)
+        self.states[data_idx] = state
+        self.actions[data_idx] = action
+        self.rewards[data_idx] = reward
+        self.next_states[data_idx] = next_state
+        self.dones[data_idx] = done
 
         tree_idx = data_idx + self.tree_capacity - 1
         self._update_tree(tree_idx, self.max_priority**self.alpha)
@@ -85,8 +98,7 @@ class PrioritizedReplayBuffer:
         total_p = self.tree[0]
         segment = total_p / batch_size
 
-        states, actions, rewards, next_states, dones = [], [], [], [], []
-        indices, weights = [], []
+        data_indices, indices, weights = [], [], []
 
         beta = self._beta()
         min_prob = np.min(self.tree[self.tree_capacity - 1 : self.tree_capacity - 1 + self.size]) / total_p
@@ -100,24 +112,20 @@ class PrioritizedReplayBuffer:
             node_idx = self._retrieve(0, cumulative_priority)
             data_idx = node_idx - (self.tree_capacity - 1)
 
-            state, action, reward, nxt, done = self.data[data_idx]
-            states.append(state)
-            actions.append(action)
-            rewards.append(reward)
-            next_states.append(nxt)
-            dones.append(done)
+            data_indices.append(data_idx)
 
             p_sample = self.tree[node_idx] / total_p
             w = (p_sample * self.size) ** (-beta)
             weights.append(w / max_weight)
             indices.append(node_idx)
 
+        batch = np.array(data_indices, dtype=np.int64)
         return (
-            np.array(states, dtype=np.float32),
-            np.array(actions, dtype=np.int64),
-            np.array(rewards, dtype=np.float32),
-            np.array(next_states, dtype=np.float32),
-            np.array(dones, dtype=bool),
+            self.states[batch],
+            self.actions[batch],
+            self.rewards[batch],
+            self.next_states[batch],
+            self.dones[batch],
             np.array(indices, dtype=np.int64),
             np.array(weights, dtype=np.float32),
         )
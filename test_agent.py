@@ -50,7 +50,7 @@ def record_all_sessions(env: TradingEnvironment, agent: D3QN_PER_Agent, sequence
         prev_position = 0
 
         for minute_step in range(cfg.seq.pre_signal_len - 1):
-            price = env.current_seq[minute_step, env.data_channels.index("close")]
+            price = env.current_seq[minute_step, env.close_idx]
             prices.append(price)
 
         for minute_step in range(cfg.seq.agent_session_len):
@@ -66,7 +66,7 @@ def record_all_sessions(env: TradingEnvironment, agent: D3QN_PER_Agent, sequence
             else:
                 effective_action = 0
 
-            price = env.current_seq[cfg.seq.pre_signal_len - 1 + minute_step, env.data_channels.index("close")]
+            price = env.current_seq[cfg.seq.pre_signal_len - 1 + minute_step, env.close_idx]
             prices.append(price)
             executed_actions.append(effective_action)
 
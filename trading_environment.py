@@ -51,6 +51,7 @@ class TradingEnvironment(gym.Env):
         self.initial_balance = initial_balance
         self.pre_signal_len = pre_signal_len
         self.data_channels = data_channels
+        self.close_idx = data_channels.index("close")
         self.slippage = slippage
         self.transaction_fee = transaction_fee
         self.agent_session_len = agent_session_len
@@ -128,7 +129,7 @@ class TradingEnvironment(gym.Env):
         price_idx = min(self.pre_signal_len - 1 + self.step_idx, len(self.current_seq) - 1)
         if price_idx >= len(self.current_seq):
             price_idx = len(self.current_seq) - 1
-        price = self.current_seq[price_idx, self.data_channels.index("close")]
+        price = self.current_seq[price_idx, self.close_idx]
         pnl_change = 0.0
 
         if action == 1 and self.position == 0:
@@ -212,7 +213,7 @@ class TradingEnvironment(gym.Env):
         unrealized = 0.0
         if self.position != 0:
             price_idx = min(len(self.current_seq) - 1, self.pre_signal_len - 1 + self.step_idx)
-            current_price = self.current_seq[price_idx, self.data_channels.index("close")]
+            current_price = self.current_seq[price_idx, self.close_idx]
             delta = (current_price - self.entry_price) * self.position
             unrealized = delta / self.entry_price
 
@@ -246,7 +247,7 @@ class TradingEnvironment(gym.Env):
 
         if self.position != 0:
             price_idx = min(len(self.current_seq) - 1, self.pre_signal_len - 1 + self.step_idx)
-            current_price = self.current_seq[price_idx, self.data_channels.index("close")]
+            current_price = self.current_seq[price_idx, self.close_idx]
             mark2market = (current_price - self.entry_price) * self.position * (self.balance / self.entry_price)
             info["portfolio_value"] = self.balance + mark2market
         else:
@@ -272,7 +273,7 @@ class TradingEnvironment(gym.Env):
                 action = 3
 
         price_idx = min(self.pre_signal_len - 1 + self.step_idx, len(self.current_seq) - 1)
-        price = self.current_seq[price_idx, self.data_channels.index("close")]
+        price = self.current_seq[price_idx, self.close_idx]
         position_closed = False
         pnl_change = 0.0
         exec_price = 0.0
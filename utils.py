@@ -11,7 +11,6 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 import seaborn as sns
 import torch
 from tqdm import tqdm
@@ -116,12 +115,12 @@ def select_and_arrange_channels(
     if raw_seq.shape[1] != len(file_channels):
         logger.error("Channel count mismatch in select_and_arrange_channels")
         return None
-    df = pd.DataFrame(raw_seq, columns=file_channels)
-    missing = [ch for ch in use_channels if ch not in df.columns]
+    col_idx = {ch: i for i, ch in enumerate(file_channels)}
+    missing = [ch for ch in use_channels if ch not in col_idx]
     if missing:
         logger.error(f"Missing channels: {missing}")
         return None
-    return df[use_channels].to_numpy(dtype=np.float32)
+    return raw_seq[:, [col_idx[ch] for ch in use_channels]].astype(np.float32, copy=False)
 
 
 def calculate_normalization_stats(
@@ -136,7 +135,7 @@ def calculate_normalization_stats(
         logger.warning("Empty training set for normalization stats")
         return stats
 
-    data_accum: Dict[str, List[float]] = {ch: [] for ch in use_channels}
+    data_accum: Dict[str, List[np.ndarray]] = {ch: [] for ch in use_channels}
     for seq in tqdm(sequences, desc="Calculating normalization stats ...", leave=False):
         for idx, ch in enumerate(use_channels):
             arr = seq[:, idx].astype(np.float64)
@@ -149,15 +148,14 @@ def calculate_normalization_stats(
                 vals = arr
             else:
                 continue
-            finite = vals[np.isfinite(vals)]
-            data_accum[ch].extend(finite.tolist())
+            data_accum[ch].append(vals[np.isfinite(vals)])
 
-    for ch, values in data_accum.items():
-        if not values:
+    for ch, chunks in data_accum.items():
+        arr = np.concatenate(chunks).astype(np.float32) if chunks else np.empty(0, dtype=np.float32)
+        if arr.size == 0:
             logger.warning(f"No data for stats on channel {ch}, defaulting to mean=0, std=1")
             stats["means"][ch], stats["stds"][ch] = 0.0, 1.0
         else:
-            arr = np.array(values, dtype=np.float32)
             m, s = float(arr.mean()), float(arr.std())
             if s < 1e-7:
                 logger.debug(f"Std too small for {ch}, setting to 1.0")